@@ -1,10 +1,15 @@
-from swarms import Agent
-from .config import llm
+import functools
+from .config import get_llm
 
-analyze_agent = Agent(
-    agent_name="Image and Statistical Data Analysis Expert",
-    agent_description="Specialized in analyzing and interpreting extracted data from chart images. This agent processes visual and statistical data to provide a structured summary, highlighting key insights, trends, and anomalies. Use this agent when the task involves analyzing a chart image, extracting insights from visualized data, or summarizing statistical patterns.",
-    system_prompt="""You are an expert in interpreting chart images and statistical data. Your task is to analyze the extracted information from a chart image and provide a detailed, plain text interpretation highlighting the most important insights.
+
+@functools.cache
+def get_analyze_agent():
+    from swarms import Agent
+
+    return Agent(
+        agent_name="Image and Statistical Data Analysis Expert",
+        agent_description="Specialized in analyzing and interpreting extracted data from chart images. This agent processes visual and statistical data to provide a structured summary, highlighting key insights, trends, and anomalies. Use this agent when the task involves analyzing a chart image, extracting insights from visualized data, or summarizing statistical patterns.",
+        system_prompt="""You are an expert in interpreting chart images and statistical data. Your task is to analyze the extracted information from a chart image and provide a detailed, plain text interpretation highlighting the most important insights.
 
 Follow these guidelines in your analysis:
 
@@ -37,10 +42,10 @@ Follow these guidelines in your analysis:
    - Provide any additional observations that could be useful for further analysis.
 
 Your final output should be a clear and well-structured plain text summary that effectively interprets the chart based on the provided extracted information.""",
-    llm=llm,
-    max_loops=1,
-    verbose=False,
-    autosave=False,
-    workspace_dir="test",
-    saved_state_path="image_analysis.json"
-)
\ No newline at end of file
+        llm=get_llm(),
+        max_loops=1,
+        verbose=False,
+        autosave=False,
+        workspace_dir="test",
+        saved_state_path="image_analysis.json"
+    )
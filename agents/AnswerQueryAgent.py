@@ -1,10 +1,15 @@
-from swarms import Agent
-from .config import llm
+import functools
+from .config import get_llm
 
-answer_query_agent = Agent(
-    agent_name="Chart Data Query Expert",
-    agent_description="Expert in answering user questions based on pre-analyzed chart data. This agent retrieves insights from existing chart interpretations and provides clear, relevant, and structured responses. Use this agent when the user asks a question related to an already analyzed chart, requests specific data points, comparisons, trends, or explanations based on extracted chart insights.",
-    system_prompt="""You are an expert in answering questions related to analyzed chart data. Your task is to respond to user queries using the provided chart analysis while ensuring clarity, relevance, and completeness.
+
+@functools.cache
+def get_answer_query_agent():
+    from swarms import Agent
+
+    return Agent(
+        agent_name="Chart Data Query Expert",
+        agent_description="Expert in answering user questions based on pre-analyzed chart data. This agent retrieves insights from existing chart interpretations and provides clear, relevant, and structured responses. Use this agent when the user asks a question related to an already analyzed chart, requests specific data points, comparisons, trends, or explanations based on extracted chart insights.",
+        system_prompt="""You are an expert in answering questions related to analyzed chart data. Your task is to respond to user queries using the provided chart analysis while ensuring clarity, relevance, and completeness.
 
 Follow these guidelines in your responses:
 
@@ -29,9 +34,9 @@ Follow these guidelines in your responses:
    - Keep answers concise while ensuring completeness.
 
 Your final output should be a well-structured, easy-to-understand response that directly addresses the user's query based on the provided chart analysis.""",
-   llm=llm,
-   max_loops=1,
-   verbose=False,
-   autosave=False,
-   saved_state_path="query_answers.json"
-)
\ No newline at end of file
+        llm=get_llm(),
+        max_loops=1,
+        verbose=False,
+        autosave=False,
+        saved_state_path="query_answers.json"
+    )
@@ -1,6 +1,9 @@
-from swarms import Agent
-from .config import client
-from google.genai import types
+from .config import get_client
+from collections import OrderedDict
+import functools
+import hashlib
+import io
+import threading
 import PIL.Image
 
 EXTRACT_PROMPT = """Analyze all charts in the provided image and extract **all possible details**. If multiple charts are present, clearly separate the extracted information for each chart. The output should follow this structure:
@@ -86,25 +89,74 @@ Each chart's data should be extracted and structured in a **clear, numerical, an
 
 """
 
+def image_digest(data: bytes) -> str:
+    """Returns a short content hash of raw image bytes, used as the extraction cache key."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
 class ExtractAgent():
-    def __init__(self, system_prompt:str = None):
+    def __init__(self, system_prompt:str = None, cache_size: int = 32):
         if system_prompt:
             self.system_prompt = system_prompt
         else:
             self.system_prompt = EXTRACT_PROMPT
 
+        from google.genai import types
+
+        # The request config only depends on the system prompt, so build it once
+        self._config = types.GenerateContentConfig(system_instruction=self.system_prompt)
+
+        # LRU cache of extractions keyed by image content hash and query
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        # The agent is shared across sessions and prefetch threads
+        self._cache_lock = threading.Lock()
+
+
+    def run(self, query: str, image: PIL.Image.Image | bytes, image_hash: str = None) -> str:
+        if image_hash is None:
+            if not isinstance(image, bytes):
+                raise ValueError("image_hash is required when passing a PIL image; use image_digest() on its encoded bytes")
+            image_hash = image_digest(image)
 
-    def run(self, query: str, image_path: str) -> str:
-        image = PIL.Image.open(image_path)
+        key = self._cache_key(image_hash, query)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
 
+        if isinstance(image, bytes):
+            image = PIL.Image.open(io.BytesIO(image))
 
-        extraction = client.models.generate_content(
+
+        extraction = get_client().models.generate_content(
             model="gemini-2.0-flash",
-            config=types.GenerateContentConfig(system_instruction=self.system_prompt),
+            config=self._config,
             contents=[query, image]
         )
 
-        return extraction.text.strip()
-    
-extract_agent = ExtractAgent()
+        result = extraction.text.strip()
+        self._store(key, result)
+
+        return result
+
+    def _cache_key(self, image_hash: str, query: str) -> str:
+        return image_hash + ":" + hashlib.blake2b(query.encode(), digest_size=16).hexdigest()
+
+    def _lookup(self, key: str):
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+            return result
+
+    def _store(self, key: str, result: str):
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
 
+@functools.cache
+def get_extract_agent() -> ExtractAgent:
+    return ExtractAgent()
@@ -1,9 +1,14 @@
-from swarms import Agent
-from .config import llm
+import functools
+from .config import get_llm
 
-recommend_agent = Agent(
-    agent_name="Prompt Recommendation Expert",
-    system_prompt="""You are an expert in generating recommended prompts for further inquiry and analysis. Your task is to provide 2-3 recommended prompts for the user to choose from, based on the previously provided chart extraction and analysis details.
+
+@functools.cache
+def get_recommend_agent():
+    from swarms import Agent
+
+    return Agent(
+        agent_name="Prompt Recommendation Expert",
+        system_prompt="""You are an expert in generating recommended prompts for further inquiry and analysis. Your task is to provide 2-3 recommended prompts for the user to choose from, based on the previously provided chart extraction and analysis details.
 
 Guidelines:
 1. The recommended prompts should be clear, actionable, and self-contained.
@@ -21,10 +26,10 @@ Guidelines:
 }
 
 Return only the JSON output as your final response.""",
-    llm=llm,
-    max_loops=1,
-    verbose=False,
-    autosave=False,
-    workspace_dir="test",
-    saved_state_path="prompt_recommendation.json"
-)
\ No newline at end of file
+        llm=get_llm(),
+        max_loops=1,
+        verbose=False,
+        autosave=False,
+        workspace_dir="test",
+        saved_state_path="prompt_recommendation.json"
+    )
@@ -1,15 +1,40 @@
-from .AnalyzeAgent import analyze_agent
-from .AnswerQueryAgent import answer_query_agent
-from .utils import *
+import functools
+from .AnalyzeAgent import get_analyze_agent
+from .AnswerQueryAgent import get_answer_query_agent
 from .config import api_key
 
+# Words that suggest a follow-up question asks for a new analysis rather than a lookup
+ANALYSIS_KEYWORDS = ("analy", "summar", "insight", "overview", "interpret")
 
-agent_router = MultiAgentRouter(
-    name="MultiAgentRouter",
-    description="""Routes user queries to the appropriate agent.
-        If the query is about analyzing a chart image, route it to analyze_agent.
-        Otherwise, route it to answer_query_agent.""",
-    agents=[analyze_agent, answer_query_agent],
-    model="gemini/gemini-2.0-flash",
-    api_key=api_key,
-)
\ No newline at end of file
+
+def route_fast_path(task: str, new_extraction: bool = None):
+    """
+    Routes without the boss agent when the intent is clear: the first query on a newly extracted
+    image goes to analyze_agent, plain follow-up questions go to answer_query_agent.
+    Returns None to let the boss agent decide, including when the caller gives no new_extraction signal.
+    """
+    if new_extraction is None:
+        return None
+    if new_extraction:
+        return get_analyze_agent().name
+
+    query = task.rsplit("\n\n", 1)[-1].lower()
+    if any(keyword in query for keyword in ANALYSIS_KEYWORDS):
+        return None
+    return get_answer_query_agent().name
+
+
+@functools.cache
+def get_agent_router():
+    from .utils import MultiAgentRouter
+
+    return MultiAgentRouter(
+        name="MultiAgentRouter",
+        description="""Routes user queries to the appropriate agent.
+            If the query is about analyzing a chart image, route it to analyze_agent.
+            Otherwise, route it to answer_query_agent.""",
+        agents=[get_analyze_agent(), get_answer_query_agent()],
+        model="gemini/gemini-2.0-flash",
+        api_key=api_key,
+        fast_path=route_fast_path,
+    )
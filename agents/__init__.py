@@ -2,4 +2,20 @@ from .AnalyzeAgent import *
 from .ExtractAgent import *
 from .RecommendAgent import *
 from .RouterAgent import *
-from .AnswerQueryAgent import *
\ No newline at end of file
+from .AnswerQueryAgent import *
+
+# Agents are built on first access so importing the package stays cheap (PEP 562)
+_LAZY_AGENTS = {
+    "analyze_agent": get_analyze_agent,
+    "extract_agent": get_extract_agent,
+    "recommend_agent": get_recommend_agent,
+    "agent_router": get_agent_router,
+    "answer_query_agent": get_answer_query_agent,
+}
+
+
+def __getattr__(name):
+    factory = _LAZY_AGENTS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return factory()
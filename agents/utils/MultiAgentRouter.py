@@ -1,7 +1,12 @@
+import copy
+import hashlib
 import os
+import threading
+import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -10,7 +15,13 @@ from swarms.structs.conversation import Conversation
 from swarms.structs.output_type import OutputType
 from swarms.utils.any_to_str import any_to_str
 
-from .function_caller_model import LiteLLMFunctionCaller
+from .function_caller_model import _SHARED_EXECUTOR, MAX_CONCURRENCY, LiteLLMFunctionCaller
+
+# Runs agents started while the boss decision is still streaming. Kept apart from _SHARED_EXECUTOR,
+# since route_task may itself run there and wait on the early run.
+_EARLY_START_EXECUTOR = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENCY, thread_name_prefix="agent-early-start"
+)
 
 
 class AgentResponse(BaseModel):
@@ -42,6 +53,9 @@ class MultiAgentRouter:
         execute_task (bool): A flag indicating whether the task should be executed by the selected agent.
         boss_system_prompt (str): A system prompt for the boss agent that includes information about all available agents.
         function_caller (OpenAIFunctionCaller): An instance of OpenAIFunctionCaller for calling the boss agent.
+        fast_path (Callable[..., Optional[str]]): An optional heuristic called with the task and any per-call context; returns an agent name to skip the boss agent, or None to defer to it.
+        stream_routing (bool): A flag indicating whether the boss decision is streamed so the selected agent can start before the decision is complete.
+        max_history (int): The maximum number of messages kept in the conversation history.
     """
 
     def __init__(
@@ -55,6 +69,9 @@ class MultiAgentRouter:
         shared_memory_system: callable = None,
         output_type: OutputType = "dict",
         execute_task: bool = True,
+        fast_path: Optional[Callable[..., Optional[str]]] = None,
+        stream_routing: bool = True,
+        max_history: int = 50,
     ):
         """
         Initializes the MultiAgentRouter with a list of agents and configuration options.
@@ -67,6 +84,9 @@ class MultiAgentRouter:
             temperature (float, optional): The temperature for the boss agent's model. Defaults to 0.1.
             output_type (Literal["json", "string"], optional): The type of output expected from the agents. Defaults to "json".
             execute_task (bool, optional): A flag indicating whether the task should be executed by the selected agent. Defaults to True.
+            fast_path (Callable[..., Optional[str]], optional): A cheap routing heuristic tried before the boss agent, called as fast_path(task, **context). Defaults to None.
+            stream_routing (bool, optional): A flag indicating whether to stream the boss decision and start the selected agent early. Defaults to True.
+            max_history (int, optional): The maximum number of messages kept in the conversation history. Defaults to 50.
         """
         self.name = name
         self.description = description
@@ -75,15 +95,24 @@ class MultiAgentRouter:
         self.execute_task = execute_task
         self.model = model
         self.temperature = temperature
+        self.fast_path = fast_path
+        self.stream_routing = stream_routing
+        self.max_history = max_history
 
         # Initialize Agents
         self.agents = {agent.name: agent for agent in agents}
+        self._agent_names = frozenset(self.agents)
         self.conversation = Conversation()
 
+        # In-flight routing calls keyed by task hash, so identical concurrent tasks share one call
+        self._inflight: dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
         self.api_key = api_key
         if not self.api_key:
             raise ValueError("OpenAI API key must be provided")
 
+        # Built once: the agent pool is fixed after construction
         self.boss_system_prompt = self._create_boss_system_prompt()
 
         self.function_caller = LiteLLMFunctionCaller(
@@ -97,6 +126,13 @@ class MultiAgentRouter:
     def __repr__(self):
         return f"MultiAgentRouter(name={self.name}, agents={list(self.agents.keys())})"
 
+    def _add_to_conversation(self, role: str, content: str):
+        """Adds a message to the conversation, dropping the oldest messages beyond max_history."""
+        self.conversation.add(role=role, content=content)
+        history = self.conversation.conversation_history
+        if len(history) > self.max_history:
+            del history[: len(history) - self.max_history]
+
     def query_ragent(self, task: str) -> str:
         """Query the ResearchAgent"""
         return self.shared_memory_system.query(task)
@@ -137,62 +173,133 @@ You must respond with a valid JSON object containing:
 
 ⚠️ Always select exactly **one** agent that best matches the task requirements."""
 
-    def route_task(self, task: str) -> dict:
+    def route_task(self, task: str, **context) -> dict:
         """
         Routes a task to the appropriate agent and returns their response.
 
+        Identical tasks submitted while a call for the same task is still in flight wait for its result
+        and receive their own copy of it with a fresh id.
+
         Args:
             task (str): The task to be routed.
+            **context: Per-call information passed to the fast path, if any.
 
         Returns:
             dict: A dictionary containing the routing result, including the selected agent, reasoning, and response.
         """
+        key = hashlib.blake2b(
+            (task + repr(sorted(context.items()))).encode(), digest_size=16
+        ).hexdigest()
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_owner:
+            result = copy.deepcopy(future.result())
+            result["id"] = str(uuid.uuid4())
+            return result
+
+        try:
+            result = self._route_task(task, context)
+            # Waiters copy a snapshot, so the owner's caller can modify its result freely
+            future.set_result(copy.deepcopy(result))
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _route_task(self, task: str, context: dict) -> dict:
+        """
+        Routes a single task without request coalescing.
+
+        When the boss decision is streamed, the selected agent may start before the decision completes.
+        If routing then fails, the early agent run is cancelled or, if already running, awaited before the
+        error is raised, so a late failure can take up to one extra agent call to surface.
+        """
+        early_execution = {}
+
+        def start_early(agent_name: str):
+            # Start the selected agent while the boss agent is still generating its reasoning
+            agent = self.agents.get(agent_name)
+            if agent is not None:
+                early_execution["agent_name"] = agent_name
+                early_execution["start"] = time.perf_counter()
+                early_execution["future"] = _EARLY_START_EXECUTOR.submit(agent.run, task)
+
         try:
-            self.conversation.add(role="user", content=task)
-            start_time = datetime.now()
+            self._add_to_conversation(role="user", content=task)
+            start_time = time.perf_counter()
+
+            # Try the fast path first, then get boss decision using function calling
+            fast_agent = self.fast_path(task, **context) if self.fast_path else None
+            if fast_agent in self._agent_names:
+                boss_response = AgentResponse(
+                    selected_agent=fast_agent,
+                    reasoning="Selected by the router's fast path",
+                )
+            elif self.execute_task and self.stream_routing:
+                boss_response: AgentResponse = self.function_caller.run_stream(
+                    task, "selected_agent", start_early
+                )
+            else:
+                boss_response: AgentResponse = self.function_caller.run(task)
 
-            # Get boss decision using function calling
-            boss_response: AgentResponse = self.function_caller.run(task)
+            if boss_response is None and "agent_name" in early_execution:
+                # The stream failed after the agent was chosen; keep the decision and the running agent
+                boss_response = AgentResponse(
+                    selected_agent=early_execution["agent_name"],
+                    reasoning="Boss response ended after selecting the agent",
+                )
+            if boss_response is None:
+                raise ValueError("Boss agent returned no routing decision")
 
             boss_response_str = any_to_str(boss_response)
 
-            self.conversation.add(
+            self._add_to_conversation(
                 role="assistant", content=boss_response_str
             )
 
-            # Validate that the selected agent exists
-            if boss_response.selected_agent not in self.agents:
+            # Get the selected agent, validating that it exists
+            selected_agent = self.agents.get(boss_response.selected_agent)
+            if selected_agent is None:
                 raise ValueError(
                     f"Boss selected unknown agent: {boss_response.selected_agent}"
                 )
 
-            # Get the selected agent
-            selected_agent = self.agents[boss_response.selected_agent]
-
             # Use the modified task if provided, otherwise use original task
             # final_task = boss_response.modified_task or task
             final_task = task
 
             # Execute the task with the selected agent if enabled
-            execution_start = datetime.now()
+            execution_start = time.perf_counter()
             agent_response = None
             execution_time = 0
 
             if self.execute_task:
-                # Use the agent's run method directly
-                agent_response = selected_agent.run(final_task)
-                self.conversation.add(
+                if early_execution.get("agent_name") == selected_agent.name:
+                    # The agent was started as soon as the boss selected it
+                    execution_start = early_execution["start"]
+                    agent_response = early_execution.pop("future").result()
+                else:
+                    # Use the agent's run method directly
+                    agent_response = selected_agent.run(final_task)
+                self._add_to_conversation(
                     role=selected_agent.name, content=agent_response
                 )
-                execution_time = (
-                    datetime.now() - execution_start
-                ).total_seconds()
+                execution_time = time.perf_counter() - execution_start
             else:
                 logger.info(
                     "Task execution skipped (execute_task=False)"
                 )
 
-            total_time = (datetime.now() - start_time).total_seconds()
+            total_time = time.perf_counter() - start_time
 
             result = {
                 "id": str(uuid.uuid4()),
@@ -231,41 +338,40 @@ You must respond with a valid JSON object containing:
         except Exception as e:
             logger.error(f"Error routing task: {str(e)}")
             raise
+        finally:
+            # Never leave an early agent run behind: it spends LLM calls and writes to the agent's memory
+            unused_future = early_execution.get("future")
+            if unused_future is not None and not unused_future.cancel():
+                try:
+                    unused_future.result()
+                except Exception as e:
+                    logger.error(f"Error in discarded early agent run: {str(e)}")
 
-    def run(self, task: str):
+    def run(self, task: str, **context):
         """Route a task to the appropriate agent and return the result"""
-        return self.route_task(task)
+        return self.route_task(task, **context)
 
-    def __call__(self, task: str):
+    def __call__(self, task: str, **context):
         """Route a task to the appropriate agent and return the result"""
-        return self.route_task(task)
+        return self.route_task(task, **context)
+
+    def batch_run(self, tasks: List[str] = []) -> List[Optional[dict]]:
+        """Batch route tasks to the appropriate agents. Returns one result per task, in order, with None for tasks that failed"""
+        return self.concurrent_batch_run(tasks)
+
+    def concurrent_batch_run(self, tasks: List[str] = []) -> List[Optional[dict]]:
+        """Concurrently route tasks to the appropriate agents. Returns one result per task, in order, with None for tasks that failed"""
+        futures = [
+            _SHARED_EXECUTOR.submit(self.route_task, task)
+            for task in tasks
+        ]
 
-    def batch_run(self, tasks: List[str] = []):
-        """Batch route tasks to the appropriate agents"""
         results = []
-        for task in tasks:
+        for future in futures:
             try:
-                result = self.route_task(task)
+                result = future.result()
                 results.append(result)
             except Exception as e:
                 logger.error(f"Error routing task: {str(e)}")
-        return results
-
-    def concurrent_batch_run(self, tasks: List[str] = []):
-        """Concurrently route tasks to the appropriate agents"""
-        import concurrent.futures
-        from concurrent.futures import ThreadPoolExecutor
-
-        results = []
-        with ThreadPoolExecutor() as executor:
-            futures = [
-                executor.submit(self.route_task, task)
-                for task in tasks
-            ]
-            for future in concurrent.futures.as_completed(futures):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    logger.error(f"Error routing task: {str(e)}")
+                results.append(None)
         return results
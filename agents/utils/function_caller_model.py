@@ -1,9 +1,19 @@
-import json
+import hashlib
 import os
+import re
+import threading
 import litellm
-from typing import List
+import orjson
+from typing import Callable, List
 from pydantic import BaseModel
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Matches a leading ```json (or bare ```) fence and a trailing ``` fence
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.DOTALL)
+
+# Shared by all callers and routers for concurrent runs; LLM calls are network-bound, so a bounded pool suffices
+MAX_CONCURRENCY = min(32, (os.cpu_count() or 4) * 4)
+_SHARED_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENCY, thread_name_prefix="agent-pool")
 
 class LiteLLMFunctionCaller:
     def __init__(
@@ -25,40 +35,124 @@ class LiteLLMFunctionCaller:
         if not self.api_key:
             raise ValueError("API key is required. Set it via env variable or pass it explicitly.")
 
+        # In-flight completions, so identical concurrent requests share one call
+        self._inflight: dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._system_prompt_hash = hashlib.blake2b(self.system_prompt.encode(), digest_size=16).hexdigest()
+
+    def _coalesce(self, task: str, call: Callable[[], object]):
+        """Runs call(), or waits for an identical in-flight request for the same task and shares its result."""
+        key = (
+            self._system_prompt_hash,
+            hashlib.blake2b(task.encode(), digest_size=16).hexdigest(),
+            self.temperature,
+        )
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = call()
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
     def run(self, task: str):
+        return self._coalesce(task, lambda: self._run(task))
+
+    def _completion_params(self, task: str) -> dict:
+        return dict(
+            model=self.model_name,
+            messages=[
+                {"role": "system", "content": self.system_prompt},
+                {"role": "user", "content": task},
+            ],
+            api_key=self.api_key,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+        )
+
+    def _parse(self, content: str):
+        # Remove Markdown formatting if it exists
+        content = _FENCE_RE.sub("", content)
+
+        parsed_content = orjson.loads(content)  # Parse into a dictionary
+        
+        if self.base_model:
+            return self.base_model.model_validate(parsed_content)  # Validate using Pydantic model
+        
+        return parsed_content  # Return as a dictionary if no Pydantic model is provided
+
+    def _run(self, task: str):
         try:
-            response = litellm.completion(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": task},
-                ],
-                api_key=self.api_key,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-            )
+            response = litellm.completion(**self._completion_params(task))
 
             content:str = response["choices"][0]["message"]["content"]
             
-            # Remove Markdown formatting if it exists
-            if content.startswith("```json"):
-                content = content.strip("```json").strip("```").strip()
-
-            parsed_content = json.loads(content)  # Parse into a dictionary
-            
-            if self.base_model:
-                return self.base_model.model_validate(parsed_content)  # Validate using Pydantic model
-            
-            return parsed_content  # Return as a dictionary if no Pydantic model is provided
+            return self._parse(content)
 
         except Exception as e:
             print(f"Error calling {self.model_name}: {e}")
             return None
 
+    def run_stream(self, task: str, field: str, on_field: Callable[[str], None]):
+        """
+        Streams the completion and calls on_field with the value of the top-level string field
+        as soon as it has been generated, before the rest of the response arrives.
+        Falls back to the blocking run if streaming fails before the field is seen.
+        Requests identical to one already in flight share its result without calling on_field.
+        """
+        return self._coalesce(task, lambda: self._run_stream(task, field, on_field))
+
+    def _run_stream(self, task: str, field: str, on_field: Callable[[str], None]):
+        key = f'"{field}"'
+        field_re = re.compile(rf'{re.escape(key)}\s*:\s*"((?:[^"\\]|\\.)*)"')
+        field_seen = False
+
+        try:
+            buffer = ""
+            # Where the field can still start; earlier text has already been ruled out
+            search_from = 0
+            for chunk in litellm.completion(**self._completion_params(task), stream=True):
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                buffer += delta
+
+                if not field_seen:
+                    match = field_re.search(buffer, search_from)
+                    if match:
+                        field_seen = True
+                        on_field(orjson.loads(f'"{match.group(1)}"'))
+                    else:
+                        # Resume at the key if it has arrived but its value is incomplete,
+                        # otherwise just before the end in case the key is split across chunks
+                        key_pos = buffer.rfind(key, search_from)
+                        search_from = key_pos if key_pos >= 0 else max(search_from, len(buffer) - len(key) + 1)
+
+            return self._parse(buffer)
+
+        except Exception as e:
+            print(f"Error streaming {self.model_name}: {e}")
+            if field_seen:
+                return None
+            return self._run(task)
+
 
     def batch_run(self, tasks: List[str]) -> List[BaseModel]:
         return [self.run(task) for task in tasks]
 
     def concurrent_run(self, tasks: List[str]) -> List[BaseModel]:
-        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
-            return list(executor.map(self.run, tasks))
\ No newline at end of file
+        return list(_SHARED_EXECUTOR.map(self.run, tasks))
\ No newline at end of file
@@ -1,28 +1,55 @@
 from agents import *
 from utils import *
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
-import tempfile
+import io
 import time
 
-def get_response(image_path, query, extraction=None):
-    
-    # If no extraction exists (or image changed), generate it.
-    if extraction is None:
-        extraction = extract_agent.run(query, image_path)
-    
-    # Run the multi-agent router to get the analysis or answer to the query.
-    output = agent_router.run("Here is extracted information about the chart: " + extraction + "\n\n" + query)
-    answer = output["execution"]['response']
+# Query used to extract chart data in the background as soon as an image is uploaded.
+PREFETCH_QUERY = "Extract all information from the charts in this image."
 
 
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    """Returns a single executor shared across Streamlit reruns."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="agent-app")
+
+
+def get_recommendations(query, answer):
     # Run the prompt recommendation agent to get recommended prompts.
-    chart_recommendation = parse_json_from_string(recommend_agent.run(f"""This is the query: {query}
+    chart_recommendation = parse_json_from_string(get_recommend_agent().run(f"""This is the query: {query}
 
 Here is the answer question: {answer}. Give me some short recommended prompts based on this information.
 """))
 
+    return chart_recommendation["recommended_prompts"]
+
+
+def get_response(image, query, extraction=None, extraction_future=None, image_hash=None):
+    
+    # If no extraction exists (or image changed), wait for the prefetch or generate it.
+    new_extraction = extraction is None
+    if new_extraction:
+        if extraction_future is not None:
+            try:
+                extraction = extraction_future.result()
+            except Exception as e:
+                # A failed prefetch should not block the query; retry the extraction directly.
+                print(f"Extraction prefetch failed: {e}")
+        if extraction is None:
+            extraction = get_extract_agent().run(query, image, image_hash)
     
-    return answer, chart_recommendation["recommended_prompts"], extraction
+    # Run the multi-agent router to get the analysis or answer to the query.
+    output = get_agent_router().run(
+        "Here is extracted information about the chart: " + extraction + "\n\n" + query,
+        new_extraction=new_extraction,
+    )
+    answer = output["execution"]['response']
+
+    # Recommendations only need the answer, so let them run while the answer is displayed.
+    recommendations_future = get_executor().submit(get_recommendations, query, answer)
+
+    return answer, recommendations_future, extraction
 
 
 if __name__ == "__main__":
@@ -32,14 +59,16 @@ if __name__ == "__main__":
     st.title("Chatbot Image Analysis and Recommendation App")
 
     # Initialize session state variables.
-    if "image_path" not in st.session_state:
-        st.session_state.image_path = None
+    if "image_bytes" not in st.session_state:
+        st.session_state.image_bytes = None
+    if "image_hash" not in st.session_state:
+        st.session_state.image_hash = None
     if "extraction" not in st.session_state:
         st.session_state.extraction = None
     if "chat_history" not in st.session_state:
         st.session_state.chat_history = []
-    if "new_image_file" not in st.session_state:
-        st.session_state.new_image_file = None
+    if "extraction_future" not in st.session_state:
+        st.session_state.extraction_future = None
 
     # Display previous chat history
     for chat in st.session_state.chat_history:
@@ -49,20 +78,26 @@ if __name__ == "__main__":
     with st.sidebar:
         st.header("Upload Chart Image")
         new_image_file = st.file_uploader("Choose an image", type=["png", "jpg", "jpeg"], key="uploader")
-        # When a new image is uploaded, save it to a temporary file.
-        # If the file differs from the previous one, update image_path and reset extraction.
+        # When a new image is uploaded, keep its bytes in memory.
+        # If its content differs from the previous one, update the image and reset extraction.
         if new_image_file is not None:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp:
-                tmp.write(new_image_file.read())
-                new_path = tmp.name
-            if st.session_state["new_image_file"] != new_image_file:
-                st.session_state.image_path = new_path
+            img_bytes = new_image_file.getvalue()
+            img_hash = image_digest(img_bytes)
+            if st.session_state.image_hash != img_hash:
+                st.session_state.image_bytes = img_bytes
+                st.session_state.image_hash = img_hash
                 st.session_state.extraction = None  # Reset extraction when image changes.
+                # Drop a pending prefetch for the previous image so it does not hold a shared worker.
+                if st.session_state.extraction_future is not None:
+                    st.session_state.extraction_future.cancel()
+                # Start extracting in the background while the user types a query.
+                st.session_state.extraction_future = get_executor().submit(
+                    get_extract_agent().run, PREFETCH_QUERY, img_bytes, img_hash
+                )
                 st.session_state.chat_history = []  # Reset chat history when image changes.
-                st.session_state["new_image_file"] = new_image_file
 
             # Display the uploaded image.
-            image = PIL.Image.open(new_path)
+            image = PIL.Image.open(io.BytesIO(img_bytes))
             st.image(image, caption="Uploaded Chart", use_column_width=True)
 
 
@@ -70,7 +105,7 @@ if __name__ == "__main__":
     user_query = st.chat_input("Message chatbot")
     if user_query:
         
-        if not st.session_state.image_path:
+        if not st.session_state.image_bytes:
             st.warning("Please upload a chart image first.")
             st.stop()
 
@@ -86,17 +121,23 @@ if __name__ == "__main__":
             start_time = time.time()
             
             # Get analysis and recommendations
-            answer, recommendations, extraction = get_response(
-                st.session_state.image_path, user_query, st.session_state.extraction
+            answer, recommendations_future, extraction = get_response(
+                st.session_state.image_bytes,
+                user_query,
+                st.session_state.extraction,
+                st.session_state.extraction_future,
+                st.session_state.image_hash,
             )
             end_time = time.time()
             
             if st.session_state.extraction is None:
                 st.session_state.extraction = extraction
+                st.session_state.extraction_future = None
 
             # Format the AI response
             response_text = f"{answer}"
-            response_text += f"\n\n_Response time: {end_time-start_time:.2f} seconds_\n\n"
+            # Recommendations are still running at this point, so this measures the answer only.
+            response_text += f"\n\n_Answer time: {end_time-start_time:.2f} seconds_\n\n"
 
             # Append AI response to chat history
             st.session_state.chat_history.append({
@@ -108,8 +149,15 @@ if __name__ == "__main__":
             with st.chat_message("assistant"):
                 st.markdown(response_text)
 
-                # Display recommended prompts
-                st.markdown(f"**Recommended**\n")
-                for idx, rec in enumerate(recommendations):
-                    st.write(f"{idx+1}. {rec}")
+                # Display recommended prompts; the answer is already shown, so a failure only hides them
+                try:
+                    recommendations = recommendations_future.result()
+                except Exception as e:
+                    print(f"Error getting recommendations: {e}")
+                    recommendations = []
+
+                if recommendations:
+                    st.markdown(f"**Recommended**\n")
+                    for idx, rec in enumerate(recommendations):
+                        st.write(f"{idx+1}. {rec}")
 
@@ -1,6 +1,9 @@
-import json
+import orjson
 import re
 
+# Code block markers around a JSON payload (e.g., ```json ... ```)
+_FENCE_RE = re.compile(r'^```json\n|\n```$')
+
 def parse_text(text: str) -> str:
     """
     Converts escaped newline characters (\n) in a string into actual new lines.
@@ -19,12 +22,14 @@ def parse_json_from_string(json_string: str):
     :param json_string: The JSON string with optional markdown code block markers.
     :return: Parsed JSON as a Python dictionary.
     """
-    # Remove code block markers (e.g., ```json ... ```)
-    clean_json_string = re.sub(r'^```json\n|\n```$', '', json_string.strip())
+    # Remove code block markers (e.g., ```json ... ```), only when a fence is present
+    clean_json_string = json_string.strip()
+    if clean_json_string.startswith("`") or clean_json_string.endswith("`"):
+        clean_json_string = _FENCE_RE.sub('', clean_json_string)
 
     # Parse JSON string into a dictionary
     try:
-        return json.loads(clean_json_string)
-    except json.JSONDecodeError as e:
+        return orjson.loads(clean_json_string)
+    except orjson.JSONDecodeError as e:
         print(f"Error decoding JSON: {e}")
         return None  # Return None if parsing fails
\ No newline at end of file